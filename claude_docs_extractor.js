@@ -22,15 +22,6 @@ async function extractClaudeCodeDocs() {
   const csvFile = csvFiles.sort().reverse()[0];
   console.log(`📄 Processing documentation from: ${csvFile}`);
 
-  // Read the CSV file
-  const csvContent = fs.readFileSync(csvFile, 'utf8');
-  
-  const parsedData = Papa.parse(csvContent, {
-    header: true,
-    dynamicTyping: true,
-    skipEmptyLines: true
-  });
-
   // Define priority categories for Claude Code
   const priorityCategories = {
     'installation': 'Installation & Setup',
@@ -41,26 +32,59 @@ async function extractClaudeCodeDocs() {
     'homepage': 'Overview & Concepts'
   };
 
-  // Extract core Claude Code documentation
-  const coreClaudeCodeDocs = parsedData.data.filter(item => 
-    priorityCategories[item.category] && 
-    item.markdown && 
-    item.token_estimate > 100 // Filter for substantial content
-  );
+  // Stream the CSV row by row and keep only the entries we write out,
+  // rather than holding the whole file and every parsed row in memory
+  let totalEntries = 0;
+  const coreClaudeCodeDocs = [];
+  const mcpDocs = [];
+
+  await new Promise((resolve, reject) => {
+    Papa.parse(fs.createReadStream(csvFile, 'utf8'), {
+      header: true,
+      // Only token_estimate is used as a number; typing every column
+      // (including the large markdown bodies) is wasted work
+      dynamicTyping: { token_estimate: true },
+      skipEmptyLines: true,
+      // Papa only strips a UTF-8 BOM from string input, not from streams
+      beforeFirstChunk: chunk => chunk.replace(/^\uFEFF/, ''),
+      step: ({ data: item }) => {
+        totalEntries++;
+
+        // Extract core Claude Code documentation
+        // Object.hasOwn so inherited keys like 'constructor' never match
+        if (Object.hasOwn(priorityCategories, item.category) &&
+            item.markdown &&
+            item.token_estimate > 100) { // Filter for substantial content
+          coreClaudeCodeDocs.push(item);
+        }
 
-  // Group by category
+        // MCP (Model Context Protocol) entries
+        if (item.category === 'modelcontextprotocol' ||
+            item.title?.toLowerCase().includes('mcp')) {
+          mcpDocs.push(item);
+        }
+      },
+      complete: resolve,
+      error: reject
+    });
+  });
+
+  // Group by category in a single pass over the core entries
   const groupedDocs = {};
   Object.keys(priorityCategories).forEach(category => {
-    groupedDocs[category] = coreClaudeCodeDocs.filter(item => item.category === category);
+    groupedDocs[category] = [];
   });
+  coreClaudeCodeDocs.forEach(item => groupedDocs[item.category].push(item));
 
   // Create organized documentation files
+  // One timestamp for the whole run so every generated file agrees
+  const generatedAt = new Date().toISOString();
   
   // 1. Core reference file
   let coreReference = `# Claude Code Core Documentation Reference\n\n`;
-  coreReference += `Generated from ${parsedData.data.length} documentation entries\n`;
+  coreReference += `Generated from ${totalEntries} documentation entries\n`;
   coreReference += `Source file: ${csvFile}\n`;
-  coreReference += `Generated on: ${new Date().toISOString()}\n\n`;
+  coreReference += `Generated on: ${generatedAt}\n\n`;
   
   Object.keys(priorityCategories).forEach(category => {
     if (groupedDocs[category].length > 0) {
@@ -84,7 +108,7 @@ async function extractClaudeCodeDocs() {
   const quickReference = `# Claude Code Quick Reference
 
 Generated from: ${csvFile}
-Last updated: ${new Date().toISOString()}
+Last updated: ${generatedAt}
 
 ## Essential Commands
 \`\`\`bash
@@ -136,17 +160,12 @@ To update with newer Claude Code documentation:
 `;
 
   // 3. MCP (Model Context Protocol) reference if available
-  const mcpDocs = parsedData.data.filter(item => 
-    item.category === 'modelcontextprotocol' || 
-    item.title?.toLowerCase().includes('mcp')
-  );
-  
   let mcpReference = '';
   if (mcpDocs.length > 0) {
     mcpReference = `# Model Context Protocol (MCP) Reference
 
 Generated from: ${csvFile}
-Last updated: ${new Date().toISOString()}
+Last updated: ${generatedAt}
 
 `;
     mcpDocs.forEach(item => {
@@ -168,7 +187,7 @@ Last updated: ${new Date().toISOString()}
   const indexFile = `# Claude Code Documentation Index
 
 Generated from: **${csvFile}**  
-Last updated: **${new Date().toISOString()}**
+Last updated: **${generatedAt}**
 
 This directory contains extracted documentation from ClaudeLog and official sources.
 
@@ -186,7 +205,7 @@ ${mcpReference ? '- **claude-code-mcp-reference.md**: Model Context Protocol int
 
 ## Documentation Statistics:
 - **Source file**: ${csvFile}
-- **Total entries processed**: ${parsedData.data.length}
+- **Total entries processed**: ${totalEntries}
 - **Core Claude Code entries**: ${coreClaudeCodeDocs.length}
 - **Categories covered**: ${Object.keys(priorityCategories).length}
 - **Token count**: ${coreClaudeCodeDocs.reduce((sum, item) => sum + (item.token_estimate || 0), 0)}
@@ -198,14 +217,14 @@ When new Claude Code features are released:
 3. Run the extractor again: \`node claude_docs_extractor.js\`
 4. The CLAUDE.md will automatically detect and use the new documentation
 
-Generated on: ${new Date().toISOString()}
+Generated on: ${generatedAt}
 `;
 
   fs.writeFileSync('README-claude-docs.md', indexFile);
 
   // Success output
   console.log('✅ Claude Code documentation extracted successfully!');
-  console.log(`📊 Processed ${parsedData.data.length} total entries`);
+  console.log(`📊 Processed ${totalEntries} total entries`);
   console.log(`🎯 Created ${coreClaudeCodeDocs.length} core documentation entries`);
   console.log('');
   console.log('📁 Files created:');